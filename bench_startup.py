@@ -0,0 +1,66 @@
+"""
+Import-time benchmark for the lightweight entry points.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for
+each module, reports the cumulative import time and fails (exit code 1) if a
+module exceeds its budget or pulls in a dependency that should stay lazy.
+
+    python bench_startup.py              # check against the default budgets
+    python bench_startup.py --budget-ms 80 --top 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MODULES = ["cli", "utils", "scraper", "graph"]
+# These must only be imported when a node/command actually needs them.
+HEAVY_MODULES = ["openai", "langgraph", "requests", "dotenv", "redis"]
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(module: str, runs: int = 3):
+    best_us, best_rows = None, []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+        rows = []
+        for line in proc.stderr.splitlines():
+            # import time:     self [us] |  cumulative | imported package
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((int(self_us), int(cum_us), name.rstrip()))
+        total = next((cum for _, cum, name in rows if name.strip() == module), 0)
+        if best_us is None or total < best_us:
+            best_us, best_rows = total, rows
+    return best_us, best_rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="max cumulative import time per module")
+    parser.add_argument("--runs", type=int, default=3, help="best-of runs per module")
+    parser.add_argument("--top", type=int, default=5, help="show the N slowest imports per module")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in MODULES:
+        total_us, rows = measure(module, args.runs)
+        leaked = sorted({name.strip().split(".")[0] for _, _, name in rows} & set(HEAVY_MODULES))
+        status = "ok"
+        if total_us / 1000 > args.budget_ms:
+            status, failed = "OVER BUDGET", True
+        if leaked:
+            status, failed = f"eager import of {', '.join(leaked)}", True
+        print(f"{module:<10} {total_us / 1000:8.2f} ms  {status}")
+        for self_us, cum_us, name in sorted(rows, key=lambda r: r[0], reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:8.2f} ms self  {cum_us / 1000:8.2f} ms cum  {name.strip()}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
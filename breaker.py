@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from collections import deque
+
+# Per-board circuit breaker. A board whose recent requests mostly fail (errors,
+# non-200 responses or calls slower than BREAKER_SLOW_CALL_SECONDS) is skipped
+# for BREAKER_COOLDOWN seconds, after which one trial request is let through.
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, window: int = 10, min_calls: int = 3, failure_rate: float = 0.5,
+                 slow_call_seconds: float = 5.0, cooldown: float = 60.0, trial_timeout: float = 10.0,
+                 enabled: bool = True):
+        self.name = name
+        self.enabled = enabled  # disabled breakers only collect stats and never skip the board
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.cooldown = cooldown
+        self.trial_timeout = trial_timeout
+        self.calls = deque(maxlen=window)  # (failed, latency) of the most recent calls
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if not self.enabled:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self.trial_started_at = now
+                return True
+            if self.state == HALF_OPEN and now - self.trial_started_at >= self.trial_timeout:
+                # The trial never reported back (e.g. its thread was abandoned), let another one through
+                self.trial_started_at = now
+                return True
+            return self.state == CLOSED
+
+    def abandon(self):
+        """The caller gave up on a request before it finished; a pending trial counts as failed."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._open()
+
+    def remaining_cooldown(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def record(self, ok: bool, latency: float):
+        failed = not ok or latency > self.slow_call_seconds
+        with self._lock:
+            self.calls.append((failed, latency))
+            if not self.enabled:
+                return
+            if self.state == HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self.state = CLOSED
+                    self.calls.clear()
+                return
+            failures = sum(1 for f, _ in self.calls if f)
+            if len(self.calls) >= self.min_calls and failures / len(self.calls) >= self.failure_rate:
+                self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        print(f"Circuit for {self.name} opened, skipping it for {self.cooldown:.0f}s")
+
+    def stats(self) -> dict:
+        latencies = [latency for _, latency in self.calls]
+        return {
+            "state": self.state,
+            "calls": len(self.calls),
+            "failures": sum(1 for f, _ in self.calls if f),
+            "avg_latency": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_overrides: dict = {}
+
+
+def reset_breakers(**overrides):
+    """Drop all breakers (and their history); new ones use `overrides` (CircuitBreaker kwargs) over the env config."""
+    with _breakers_lock:
+        _breakers.clear()
+        _overrides.clear()
+        _overrides.update(overrides)
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Process-wide breaker per board, so its history survives across runs in a long-lived worker."""
+    with _breakers_lock:
+        if name not in _breakers:
+            config = dict(
+                window=int(os.getenv("BREAKER_WINDOW", 10)),
+                min_calls=int(os.getenv("BREAKER_MIN_CALLS", 3)),
+                failure_rate=float(os.getenv("BREAKER_FAILURE_RATE", 0.5)),
+                slow_call_seconds=float(os.getenv("BREAKER_SLOW_CALL_SECONDS", 5)),
+                cooldown=float(os.getenv("BREAKER_COOLDOWN", 60)),
+                trial_timeout=float(os.getenv("SCRAPE_REQUEST_TIMEOUT", 10)),
+            )
+            _breakers[name] = CircuitBreaker(name, **{**config, **_overrides})
+        return _breakers[name]
@@ -0,0 +1,82 @@
+import argparse
+import json
+import sys
+
+
+# Only stdlib is imported at module level; each command pulls in what it
+# needs so that e.g. `cli.py toon` never loads openai or langgraph.
+
+def cmd_search(args):
+    from graph import JobAgent, AgentState
+
+    JobAgent().run(
+        AgentState(
+            initialise=True,
+            preference={
+                "designation": args.designation,
+                "location": args.location,
+                "skills": args.skills,
+                "job_type": args.job_type,
+                "experience": args.experience,
+            },
+            output_dir=args.output_dir))
+
+def cmd_scrape(args):
+    from scraper import NaurkiScraper, HiristScraper
+
+    if args.source == "naukri":
+        jobs = NaurkiScraper().scrape(location=args.location,
+                                      search_term=args.query,
+                                      job_type=args.job_type,
+                                      experience=args.experience,
+                                      page_count=args.pages)
+    else:
+        jobs = HiristScraper().scrape(query=args.query,
+                                      location=args.location,
+                                      min_exp=args.experience,
+                                      max_exp=int(args.experience) + 2,
+                                      page_count=args.pages)
+    with open(args.output, "w") as f:
+        json.dump(jobs, f, indent=4)
+    print(f"Saved {len(jobs)} jobs to {args.output}")
+
+def cmd_toon(args):
+    from utils import convert_json_to_toon
+
+    with open(args.input) if args.input != "-" else sys.stdin as f:
+        print(convert_json_to_toon(f.read()))
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="jobfinder", description="JobFinder command line")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    search = sub.add_parser("search", help="Run the full search, scoring and report workflow")
+    search.add_argument("--designation", required=True)
+    search.add_argument("--location", required=True)
+    search.add_argument("--skills", default="")
+    search.add_argument("--job-type", default="Hybrid", choices=["Work from office", "Remote", "Hybrid"])
+    search.add_argument("--experience", default="2")
+    search.add_argument("--output-dir", default=None, help="where to write results (default: runs/<run id>)")
+    search.set_defaults(func=cmd_search)
+
+    scrape = sub.add_parser("scrape", help="Scrape a single job board to JSON without the LLM")
+    scrape.add_argument("--source", default="naukri", choices=["naukri", "hirist"])
+    scrape.add_argument("--query", required=True)
+    scrape.add_argument("--location", required=True)
+    scrape.add_argument("--job-type", default="Hybrid")
+    scrape.add_argument("--experience", default="2")
+    scrape.add_argument("--pages", type=int, default=1)
+    scrape.add_argument("--output", default="scraped_data.json")
+    scrape.set_defaults(func=cmd_scrape)
+
+    toon = sub.add_parser("toon", help="Convert a JSON file (or - for stdin) to TOON")
+    toon.add_argument("input")
+    toon.set_defaults(func=cmd_toon)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import csv
+import html
+import json
+import os
+import threading
+
+# Each exporter streams rows to "<path>.part" as soon as they arrive (so the
+# file can be tailed during a run) and atomically renames it to "<path>" on
+# close, so readers never see a half-written final file.
+
+CSV_FIELDS = ["job_id", "score", "title", "company", "location", "salary", "experience",
+              "skills", "skill_coverage", "missing_skills", "rating", "post_date", "url"]
+
+
+class Exporter:
+    extension = ""
+
+    def __init__(self, output_dir: str, name: str = "results"):
+        self.path = os.path.join(output_dir, f"{name}.{self.extension}")
+        self.tmp_path = self.path + ".part"
+        self.count = 0
+        self._f = open(self.tmp_path, "w", encoding="utf-8", newline="")
+        self.begin()
+
+    def begin(self):
+        pass
+
+    def end(self):
+        pass
+
+    def write_row(self, job: dict):
+        raise NotImplementedError
+
+    def write(self, job: dict):
+        self.write_row(job)
+        self.count += 1
+        self._f.flush()
+
+    def close(self):
+        if self._f.closed:
+            return
+        self.end()
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+        os.replace(self.tmp_path, self.path)
+
+
+class NDJSONExporter(Exporter):
+    extension = "ndjson"
+
+    def write_row(self, job):
+        self._f.write(json.dumps(job, ensure_ascii=False) + "\n")
+
+
+class JSONExporter(Exporter):
+    extension = "json"
+
+    def begin(self):
+        self._f.write("[")
+
+    def write_row(self, job):
+        self._f.write(("," if self.count else "") + "\n  " + json.dumps(job, ensure_ascii=False))
+
+    def end(self):
+        self._f.write("\n]\n")
+
+
+class CSVExporter(Exporter):
+    extension = "csv"
+
+    def begin(self):
+        self._writer = csv.DictWriter(self._f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write_row(self, job):
+        self._writer.writerow(job)
+
+
+class HTMLExporter(Exporter):
+    extension = "html"
+
+    def begin(self):
+        self._f.write("""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Job results</title>
+<style>
+body{font-family:sans-serif;margin:2rem;color:#222}
+table{border-collapse:collapse;width:100%}
+th,td{padding:.5rem;border-bottom:1px solid #eee;text-align:left;vertical-align:top}
+.score{font-weight:bold}
+</style></head><body>
+<h1>Job results</h1>
+<table>
+<tr><th>Score</th><th>Title</th><th>Company</th><th>Location</th><th>Experience</th><th>Skills</th><th></th></tr>
+""")
+
+    def write_row(self, job):
+        score = job.get("score")
+        cells = [job.get(k) or "" for k in ("title", "company", "location", "experience", "skills")]
+        url = html.escape(str(job.get("url") or ""), quote=True)
+        self._f.write(
+            f'<tr><td class="score">{"N/A" if score is None else score}</td>'
+            + "".join(f"<td>{html.escape(str(c))}</td>" for c in cells)
+            + (f'<td><a href="{url}">Explore</a></td>' if url else "<td></td>")
+            + "</tr>\n")
+
+    def end(self):
+        self._f.write("</table>\n</body></html>\n")
+
+
+EXPORTERS = {
+    "ndjson": NDJSONExporter,
+    "json": JSONExporter,
+    "csv": CSVExporter,
+    "html": HTMLExporter,
+}
+
+
+class ResultWriter:
+    """Fans scored jobs out to every configured exporter; safe to share between evaluate_jobs branches."""
+
+    def __init__(self, output_dir: str, formats):
+        unknown = [f for f in formats if f not in EXPORTERS]
+        if unknown:
+            raise ValueError(f"Unknown export format(s): {', '.join(unknown)}")
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.exporters = [EXPORTERS[f](output_dir) for f in formats]
+        self._lock = threading.Lock()
+
+    def write(self, job: dict):
+        with self._lock:
+            for exporter in self.exporters:
+                exporter.write(job)
+
+    def close(self):
+        with self._lock:
+            for exporter in self.exporters:
+                exporter.close()
+        return [exporter.path for exporter in self.exporters]
+
+
+_writers: dict[str, ResultWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_export_formats():
+    return [f.strip().lower() for f in os.getenv("EXPORT_FORMATS", "ndjson,csv,json,html").split(",") if f.strip()]
+
+
+def get_result_writer(output_dir: str) -> ResultWriter:
+    """One writer per run directory, opened on first use."""
+    with _writers_lock:
+        if output_dir not in _writers:
+            _writers[output_dir] = ResultWriter(output_dir, get_export_formats())
+        return _writers[output_dir]
+
+
+def close_result_writer(output_dir: str):
+    """Finalise (atomically rename) all exports of a run; returns the written paths."""
+    writer = get_result_writer(output_dir)
+    with _writers_lock:
+        _writers.pop(output_dir, None)
+    return writer.close()
+
+
+def write_atomic(path: str, content: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".part"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
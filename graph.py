@@ -1,17 +1,19 @@
 import os
 import json
+import heapq
+import time
+from functools import lru_cache
 from uuid import uuid4
-from dotenv import load_dotenv
-from scraper import NaurkiScraper, HiristScraper
-from typing import TypedDict, Literal, Annotated
+from typing import TypedDict, Annotated
 import operator
-from langgraph.types import Send
-from langgraph.checkpoint.redis import RedisSaver  
-from langgraph.graph import StateGraph, END, START
-from langgraph.types import interrupt, Command
-from utils import parsed_user_data, llm_structure, llm, convert_json_to_toon
-
-load_dotenv()
+import queue
+import threading
+from scraper import NaurkiScraper, HiristScraper
+from utils import load_env, llm_structure, llm, convert_json_to_toon, get_token_usage, pop_token_usage, get_model, get_node_tier
+from exporters import get_result_writer, close_result_writer, write_atomic
+from jobstore import JobStore, external_sort, get_experience
+from breaker import OPEN
+from skills import get_taxonomy, encode_preference
 
 class AgentState(TypedDict):
     initialise : bool
@@ -20,13 +22,25 @@ class AgentState(TypedDict):
     scraped_data: list | None
     evaluated_jobs: Annotated[list, operator.add]
     result: str | None
+    output_dir: str | None
+    # Large-scale mode: scraped jobs live in an on-disk JobStore at scraped_path instead of scraped_data
+    large_scale: bool
+    scraped_path: str | None
+    # Boards that were skipped or cut short: [{"source", "reason", "state", "calls", "failures", "avg_latency"}]
+    skipped_sources: list | None
+    # Aggregated LLM token usage of the run, incl. prompt-cache hits (see utils.TokenUsage.summary)
+    token_usage: dict | None
 
 class BatchState(TypedDict):
     jobs: list[dict]
     preference: dict
+    output_dir: str
+    # Large-scale mode: the batch is read from scraped_path instead of being carried in jobs
+    scraped_path: str | None
+    offset: int
+    count: int
 
 req : str | None = None
-DB_URI = os.getenv("DB_URI")
 
 
 def initialise_state(state: AgentState):
@@ -34,6 +48,14 @@ def initialise_state(state: AgentState):
     state["initialise"] = True
     state["scraped_data"] = []
     state["evaluated_jobs"] = []
+    if not state.get("output_dir"):
+        # Per-run directory so concurrent runs never overwrite each other's exports
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:8]}"
+        state["output_dir"] = os.path.join(os.getenv("OUTPUT_DIR", "runs"), run_id)
+    if not state.get("large_scale"):
+        state["large_scale"] = os.getenv("LARGE_SCALE_MODE", "").lower() in ("1", "true", "yes")
+    state["scraped_path"] = None
+    state["skipped_sources"] = []
     return state
 def prepare_scraping_query(state:AgentState):
     print("Preparing scraping query")
@@ -64,11 +86,13 @@ def prepare_scraping_query(state:AgentState):
                     "experience": "" 
                 }}
             """
-    response = llm_structure(prompt)
+    response = llm_structure(prompt, usage=get_token_usage(state["output_dir"]),
+                             tier=get_node_tier("prepare_scraping_query", "fast"))
     state["scrape_query"] = response
     return state
 def scape_jobs(state:AgentState):
     print("Scraping jobs")
+    load_env()
     page_count =  os.getenv("MAX_PAGE_COUNT", 2)
     naukri_scrapper = NaurkiScraper()
     hirist_scrapper = HiristScraper()
@@ -83,60 +107,135 @@ def scape_jobs(state:AgentState):
     
     if query == "" or location == "" or job_type == "" or experience == "":
         raise Exception("Opps!! Invalid scrape query")
-    naukri_response = naukri_scrapper.scrape(location=location,
+    # Optional per-run latency budget: return whatever was scraped once it is spent
+    budget = os.getenv("SCRAPE_DEADLINE")
+    deadline = time.monotonic() + float(budget) if budget else None
+    naukri_pages = naukri_scrapper.iter_pages(location=location,
                                             search_term=query,
                                             job_type=job_type,
                                             experience=experience,
-                                            page_count=int(page_count))
-    hirist_response = hirist_scrapper.scrape(query=query,
+                                            page_count=int(page_count),
+                                            deadline=deadline)
+    hirist_pages = hirist_scrapper.iter_pages(query=query,
                                         location=location,
                                         min_exp=experience,
                                         max_exp=int(experience)+2,
-                                        page_count=int(page_count))       
-    state["scraped_data"].extend(naukri_response)
-    state["scraped_data"].extend(hirist_response)
+                                        page_count=int(page_count),
+                                        deadline=deadline)       
+    sources = [(naukri_scrapper, naukri_pages), (hirist_scrapper, hirist_pages)]
+    store = None
+    if state.get("large_scale"):
+        # Spill each page to disk as it arrives instead of accumulating it in the state
+        store = JobStore(os.path.join(state["output_dir"], "scraped.ndjson"))
+        state["scraped_path"] = store.path
+    for jobs in _scrape_concurrently(sources, deadline):
+        if store is not None:
+            store.append(jobs)
+        else:
+            state["scraped_data"].extend(jobs)
+
+    for scraper, _ in sources:
+        if not scraper.stopped_reason and scraper.breaker.state == OPEN:
+            scraper.stopped_reason = "circuit opened during this run"
+        if scraper.stopped_reason:
+            state["skipped_sources"].append({"source": scraper.name, "reason": scraper.stopped_reason,
+                                             **scraper.breaker.stats()})
+    if state["skipped_sources"]:
+        print("Skipped sources: " + ", ".join(f"{s['source']} ({s['reason']})" for s in state["skipped_sources"]))
     return state
+
+def _scrape_concurrently(sources, deadline=None):
+    """
+    Run each board's page iterator in its own thread and yield pages in arrival
+    order, so a slow board cannot hold up the others. Stops waiting at the deadline;
+    boards still running then are marked as cut short.
+    """
+    pages = queue.Queue()
+    done = object()
+
+    def run(index, pages_iter):
+        try:
+            for jobs in pages_iter:
+                pages.put((index, jobs))
+        except Exception as e:
+            print(f"Exception: {str(e)}")
+        finally:
+            pages.put((index, done))
+
+    running = set(range(len(sources)))
+    for index, (_, pages_iter) in enumerate(sources):
+        threading.Thread(target=run, args=(index, pages_iter), daemon=True).start()
+    while running:
+        timeout = None if deadline is None else deadline - time.monotonic()
+        try:
+            if timeout is not None and timeout <= 0:
+                raise queue.Empty
+            index, item = pages.get(timeout=timeout)
+        except queue.Empty:
+            break
+        if item is done:
+            running.discard(index)
+        else:
+            yield item
+    for index in running:
+        scraper = sources[index][0]
+        scraper.stopped_reason = scraper.stopped_reason or "deadline exceeded"
+
 def refine_scape_jobs_data(state:AgentState):
     print("Refining scraped jobs data")
+    if state.get("scraped_path"):
+        # Sort by experience in ascending order without loading every job into memory
+        chunk_size = int(os.getenv("SORT_CHUNK_SIZE", 5000))
+        sorted_path = os.path.join(state["output_dir"], "sorted.ndjson")
+        external_sort(JobStore(state["scraped_path"]), sorted_path, key=get_experience, chunk_size=chunk_size)
+        # The store file only exists once something was appended (nothing may have been scraped)
+        if os.path.exists(state["scraped_path"]):
+            os.remove(state["scraped_path"])
+        return {"scraped_path": sorted_path}
+
     scaped_jobs = state["scraped_data"]
     if not scaped_jobs:
         return {"scraped_data": []}
     
-    def get_experience(job):
-        import re
-        exp_str = str(job.get("experience", ""))
-        match = re.search(r'\d+', exp_str)
-        return int(match.group()) if match else 100
     # Sort by experience in ascending order
     data = sorted(scaped_jobs, key=get_experience)
     return {"scraped_data": data}
 
+def _iter_scraped_jobs(state: AgentState):
+    if state.get("scraped_path"):
+        return iter(JobStore(state["scraped_path"]))
+    return iter(state.get("scraped_data") or [])
+
 def route_to_evaluate_jobs(state: AgentState):
-    data = state["scraped_data"]
+    from langgraph.types import Send
     preference = state["preference"]
     sends = []
     chunk_size = 10
+    if state.get("scraped_path"):
+        # Only send a (file, offset, count) reference; evaluate_jobs reads its own batch
+        for offset, count in JobStore(state["scraped_path"]).batches(chunk_size):
+            sends.append(Send("evaluate_jobs", {"jobs": [], "preference": preference,
+                                                "output_dir": state["output_dir"],
+                                                "scraped_path": state["scraped_path"],
+                                                "offset": offset, "count": count}))
+        return sends
+    data = state["scraped_data"]
     for i in range(0, len(data), chunk_size):
         chunk = data[i:i + chunk_size]
-        job_payload = []
-        for job in chunk:
-            job_payload.append({
-                "job_id": job.get("job_id"),
-                "description": job.get("description")
-            })
-        
-        sends.append(Send("evaluate_jobs", {"jobs": job_payload, "preference": preference}))
+        sends.append(Send("evaluate_jobs", {"jobs": chunk, "preference": preference,
+                                            "output_dir": state["output_dir"]}))
         
     return sends
-def evaluate_jobs(state : BatchState):
-    print("Evaluating jobs")
-    jobs = state.get("jobs", [])
-    preference = state.get("preference", {})
-    
-    instruction = f"""
-    Evaluate the following jobs based on the user's preferences.
-    User preferences: \n{preference}
-    Jobs: \n{jobs}
+def _evaluation_prompt(jobs, preference):
+    # (system, user) messages. Everything that is the same for every batch of a run
+    # (instructions, schema, preferences) is the system message so providers can
+    # serve it from their prompt cache; only the job list changes between calls.
+    # Providers only cache prefixes above a minimum length (1024 tokens for OpenAI),
+    # so with short preferences this prefix is simply sent uncached.
+    jobs = [{"job_id": job.get("job_id"), "description": job.get("description")} for job in jobs]
+    system = f"""
+    Evaluate the jobs listed in the user message based on the user's preferences.
+    Return a score for every job_id in the list.
     Response format must be JSON.
     {{
         "jobs": [
@@ -146,10 +245,162 @@ def evaluate_jobs(state : BatchState):
             }}
         ]
     }}
+    User preferences: \n{json.dumps(preference, sort_keys=True, ensure_ascii=False)}
     """
-    
-    response = llm_structure(instruction)
-    return {"evaluated_jobs": response["jobs"]}
+    return system, f"Jobs: \n{json.dumps(jobs, ensure_ascii=False)}"
+
+def _parse_score(score):
+    # Accept ints, floats and numeric strings in the 0-10 range, reject the rest ("N/A", None, True, ...)
+    if isinstance(score, bool):
+        return None
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return None
+    if 0 <= score <= 10:
+        return int(score) if score.is_integer() else score
+    return None
+
+def _score_batch(jobs, preference, usage=None, tier=None):
+    """Single LLM call for a batch; returns {job_id: score} for every valid, requested job."""
+    system, prompt = _evaluation_prompt(jobs, preference)
+    response = llm_structure(prompt, usage=usage, tier=tier, system=system)
+    if not isinstance(response, dict) or not isinstance(response.get("jobs"), list):
+        raise ValueError(f"Response has no 'jobs' list: {str(response)[:200]}")
+    requested = {str(job.get("job_id")) for job in jobs}
+    scores = {}
+    for item in response["jobs"]:
+        if not isinstance(item, dict):
+            continue
+        job_id = str(item.get("job_id"))
+        score = _parse_score(item.get("score"))
+        if job_id in requested and score is not None:
+            scores[job_id] = score
+    return scores
+
+# HTTP statuses that will not go away by retrying (bad key, no access, unknown model)
+NON_RETRYABLE_STATUS = {401, 403, 404}
+# Rejections caused by the request content (context length exceeded, content filter), i.e. by
+# one of the jobs: retrying the same batch is pointless, bisecting isolates the job
+JOB_SPECIFIC_STATUS = {400, 422}
+
+def _unscored(jobs, error):
+    return [{"job_id": str(job.get("job_id")), "score": None, "error": error} for job in jobs]
+
+def _evaluate_batch(jobs, preference, max_retries, backoff, usage=None, tier=None, budget=None):
+    """
+    Score a batch, tolerating failures:
+    - errors are retried with exponential backoff,
+    - jobs the model skipped (or scored with a non-number) are re-submitted on their own,
+    - a batch whose responses stay malformed or partial is bisected to isolate the bad job,
+    - requests rejected for their content (400/422, e.g. context length or content filter)
+      and empty (None) responses are bisected right away without retrying,
+    - transport/provider errors (outage, rate limit, auth) are not job specific, so the
+      whole batch is given up on instead of bisecting; auth-like errors fail fast,
+    - `budget` caps the LLM calls spent on the batch including all bisected halves
+      (EVAL_MAX_ATTEMPTS); unscored jobs come back with score None and the last error.
+    """
+    if budget is None:
+        budget = [int(os.getenv("EVAL_MAX_ATTEMPTS", 20))]
+    scores = {}
+    pending = list(jobs)
+    last_error = "no score returned"
+    batch_error = False
+    for attempt in range(max_retries):
+        if budget[0] <= 0:
+            last_error = f"attempt budget exhausted ({last_error})"
+            batch_error = True
+            break
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        budget[0] -= 1
+        try:
+            scores.update(_score_batch(pending, preference, usage, tier))
+        except ValueError as e:
+            # Malformed JSON / missing "jobs": may be caused by one of the jobs, bisect if it persists
+            last_error, batch_error = str(e), False
+            print(f"Evaluation attempt {attempt + 1}/{max_retries} failed for {len(pending)} jobs: {e}")
+            continue
+        except TypeError as e:
+            # message.content was None (refusal / content filter): caused by the content, bisect
+            last_error, batch_error = f"empty response ({e})", False
+            print(f"Evaluation attempt {attempt + 1}/{max_retries} got no content for {len(pending)} jobs")
+            break
+        except Exception as e:
+            last_error = str(e)
+            print(f"Evaluation attempt {attempt + 1}/{max_retries} failed for {len(pending)} jobs: {e}")
+            if getattr(e, "status_code", None) in JOB_SPECIFIC_STATUS:
+                batch_error = False
+                break
+            batch_error = True
+            if getattr(e, "status_code", None) in NON_RETRYABLE_STATUS:
+                break
+            continue
+        batch_error = False
+        pending = [job for job in pending if str(job.get("job_id")) not in scores]
+        if not pending:
+            break
+        last_error = "no score returned"
+
+    results = [{"job_id": job_id, "score": score} for job_id, score in scores.items()]
+    if not pending:
+        return results
+    if batch_error or len(pending) == 1:
+        print(f"Giving up on {len(pending)} jobs: {last_error}")
+        return results + _unscored(pending, last_error)
+    mid = len(pending) // 2
+    print(f"Bisecting {len(pending)} unscored jobs")
+    results.extend(_evaluate_batch(pending[:mid], preference, max_retries, backoff, usage, tier, budget))
+    results.extend(_evaluate_batch(pending[mid:], preference, max_retries, backoff, usage, tier, budget))
+    return results
+
+def evaluate_jobs(state : BatchState):
+    print("Evaluating jobs")
+    jobs = state.get("jobs", [])
+    if state.get("scraped_path"):
+        jobs = JobStore(state["scraped_path"]).read_batch(state["offset"], state["count"])
+    preference = state.get("preference", {})
+    max_retries = int(os.getenv("EVAL_MAX_RETRIES", 3))
+    backoff = float(os.getenv("EVAL_RETRY_BACKOFF", 1.0))
+    if not jobs:
+        return {"evaluated_jobs": []}
+    usage = get_token_usage(state["output_dir"])
+    triage_tier = get_node_tier("evaluate_jobs", "fast")
+    rescore_tier = get_node_tier("evaluate_jobs_rescore", "strong")
+    results = _evaluate_batch(jobs, preference, max(1, max_retries), backoff, usage, triage_tier)
+    for item in results:
+        item["model_tier"] = triage_tier
+
+    # Cascade: most jobs are clear rejects, so only those the triage model put in the
+    # uncertain/high band (score >= CASCADE_MIN_SCORE) are re-scored by the stronger model.
+    if get_model(rescore_tier) != get_model(triage_tier):
+        min_score = float(os.getenv("CASCADE_MIN_SCORE", 4))
+        candidates = {item["job_id"] for item in results if item["score"] is not None and item["score"] >= min_score}
+        if candidates:
+            print(f"Re-scoring {len(candidates)}/{len(jobs)} jobs with the {rescore_tier} model")
+            rescored = _evaluate_batch([job for job in jobs if str(job.get("job_id")) in candidates],
+                                       preference, max(1, max_retries), backoff, usage, rescore_tier)
+            rescored = {item["job_id"]: item["score"] for item in rescored if item["score"] is not None}
+            for item in results:
+                if item["job_id"] in rescored:
+                    # A job the strong model could not score keeps its triage score
+                    item["triage_score"] = item["score"]
+                    item["score"] = rescored[item["job_id"]]
+                    item["model_tier"] = rescore_tier
+
+    # Stream this batch to the run's exports right away instead of waiting for the whole run,
+    # with how well each job's skills cover the preferred (and must-have) skills
+    scores = {item["job_id"]: item["score"] for item in results}
+    # Skills outside the canonical taxonomy only get bits in this batch's copy
+    taxonomy = get_taxonomy().extend()
+    preferred, must_have = encode_preference(preference, taxonomy)
+    writer = get_result_writer(state["output_dir"])
+    for job in jobs:
+        mask = taxonomy.encode(job.get("skills"))
+        coverage = round((mask & preferred).bit_count() / preferred.bit_count(), 2) if preferred else None
+        writer.write({**job, "score": scores.get(str(job.get("job_id"))), "skill_coverage": coverage,
+                      "missing_skills": ", ".join(taxonomy.decode(must_have & ~mask))})
+    return {"evaluated_jobs": results}
     
 def format_job_data(state:AgentState):
     print("Formatting job data")
@@ -157,59 +408,121 @@ def format_job_data(state:AgentState):
             Convert the given JSON array of job listings (same fields in each item) into ONE Simple Minimalistic HTML Email (HTML + CSS + JS in a single file) with Explore ("url") buttons.
             Input data:
             """
-    jobs = state.get("scraped_data", [])
     evaluated_jobs = state.get("evaluated_jobs", [])
-    job_list = []
+    # Only the best REPORT_MAX_JOBS go into the report prompt, so its size (and this node's
+    # memory) stays bounded however many jobs were scraped; all of them are in the exports.
+    max_jobs = int(os.getenv("REPORT_MAX_JOBS", 50))
+    top = []
     
-    if not jobs:
+    if not evaluated_jobs:
         state["result"] = "No jobs found matching your criteria."
         return state
-    eval_lookup = {item["job_id"]: item for item in evaluated_jobs}
-    for i, job in enumerate(jobs, 1):
-        eval_data = eval_lookup.get(job.get("job_id"), {})
-        score = eval_data.get("score", "N/A")
+    eval_lookup = {str(item.get("job_id")): item for item in evaluated_jobs}
+    unscored = 0
+    matched = 0
+    for i, job in enumerate(_iter_scraped_jobs(state), 1):
+        eval_data = eval_lookup.get(str(job.get("job_id")), {})
+        score = _parse_score(eval_data.get("score"))
     
-        if score >=5 :
-            job_list.append(job)
-    response = llm(prompt+ convert_json_to_toon(job_list))
-    state["result"] = response.split("```html")[1].split("```")[0]
+        if score is None:
+            unscored += 1
+        elif score >=5 :
+            matched += 1
+            # min-heap of (score, -position): keeps the highest scores, earlier jobs first on ties
+            entry = (score, -i, job)
+            if len(top) < max_jobs:
+                heapq.heappush(top, entry)
+            elif entry[:2] > top[0][:2]:
+                heapq.heapreplace(top, entry)
+    if unscored:
+        print(f"{unscored} jobs could not be scored and were left out")
+    if matched > len(top):
+        print(f"Report limited to the top {len(top)} of {matched} matching jobs")
+    job_list = [job for _, _, job in sorted(top, key=lambda e: e[:2], reverse=True)]
+    try:
+        response = llm(prompt+ convert_json_to_toon(job_list), usage=get_token_usage(state["output_dir"]),
+                       tier=get_node_tier("format_job_data", "strong"))
+        state["result"] = _extract_html(response)
+    except Exception as e:
+        # The streamed exports already hold every scored job; don't lose the run over the report
+        print(f"Error generating HTML report: {e}")
+        state["result"] = None
     return state
 
+def _extract_html(response: str) -> str:
+    """HTML from the model's answer, whether it is fenced as ```html, as a bare ``` block or not fenced at all."""
+    if "```html" in response:
+        return response.split("```html", 1)[1].split("```", 1)[0]
+    parts = response.split("```")
+    if len(parts) >= 3:
+        return parts[1]
+    return response
+
 def share_job_results_with_user(state:AgentState):
+    output_dir = state["output_dir"]
+    usage = pop_token_usage(output_dir).summary()
+    state["token_usage"] = usage
+    print(f"LLM usage: {usage['calls']} calls, {usage['prompt_tokens']} prompt tokens "
+          f"({usage['cached_prompt_tokens']} cached, {usage['cache_hit_rate']:.0%} hit rate, "
+          f"~{usage['prompt_cost_saved']:.0%} prompt cost saved), {usage['completion_tokens']} completion tokens")
+    for tier, t in usage["tiers"].items():
+        cost = "n/a" if t["cost_usd"] is None else f"${t['cost_usd']:.4f}"
+        print(f"  {tier} ({t['model']}): {t['calls']} calls, avg {t['avg_latency_s']}s, cost {cost}")
+    saved = []
     try:
-        with open("index.html", "w") as f:
-            f.write(state.get("result"))
+        if state.get("result"):
+            write_atomic(os.path.join(output_dir, "index.html"), state["result"])
+            saved.append("index.html")
+        write_atomic(os.path.join(output_dir, "usage.json"), json.dumps(usage, indent=4))
+        saved.append("usage.json")
     except Exception as e:
         print(f"Error writing to file: {e}")
+    finally:
+        # Always finalise the streamed exports, even if the report could not be written
+        try:
+            saved.extend(os.path.basename(p) for p in close_result_writer(output_dir))
+        except Exception as e:
+            print(f"Error finalising exports: {e}")
+    print(f"Results saved to {output_dir}: " + ", ".join(saved))
     return state
 
-graph = StateGraph(AgentState)
-graph.add_node("initialise", initialise_state)
-graph.add_node("prepare_scraping_query", prepare_scraping_query)
-graph.add_node("scape_jobs", scape_jobs)
-graph.add_node("refine_scape_jobs_data", refine_scape_jobs_data)
-graph.add_node("evaluate_jobs", evaluate_jobs)
-graph.add_node("format_job_data", format_job_data)
-graph.add_node("share_job_results_with_user", share_job_results_with_user)
-graph.add_edge(START, "initialise")
-graph.add_edge("initialise", "prepare_scraping_query")
-graph.add_edge("prepare_scraping_query", "scape_jobs")
-graph.add_edge("scape_jobs", "refine_scape_jobs_data")
-
-graph.add_conditional_edges("refine_scape_jobs_data", route_to_evaluate_jobs, ["evaluate_jobs"])
-
-graph.add_edge("evaluate_jobs", "format_job_data")
-graph.add_edge("format_job_data", "share_job_results_with_user")
-graph.add_edge("share_job_results_with_user", END)
+@lru_cache(maxsize=None)
+def get_graph():
+    """Build and compile the workflow once per process.
+
+    langgraph is imported here rather than at module level so that importing
+    this module (e.g. for AgentState or a single node) does not pay for it.
+    """
+    from langgraph.graph import StateGraph, END, START
+
+    graph = StateGraph(AgentState)
+    graph.add_node("initialise", initialise_state)
+    graph.add_node("prepare_scraping_query", prepare_scraping_query)
+    graph.add_node("scape_jobs", scape_jobs)
+    graph.add_node("refine_scape_jobs_data", refine_scape_jobs_data)
+    graph.add_node("evaluate_jobs", evaluate_jobs)
+    graph.add_node("format_job_data", format_job_data)
+    graph.add_node("share_job_results_with_user", share_job_results_with_user)
+    graph.add_edge(START, "initialise")
+    graph.add_edge("initialise", "prepare_scraping_query")
+    graph.add_edge("prepare_scraping_query", "scape_jobs")
+    graph.add_edge("scape_jobs", "refine_scape_jobs_data")
+
+    graph.add_conditional_edges("refine_scape_jobs_data", route_to_evaluate_jobs, ["evaluate_jobs"])
+
+    graph.add_edge("evaluate_jobs", "format_job_data")
+    graph.add_edge("format_job_data", "share_job_results_with_user")
+    graph.add_edge("share_job_results_with_user", END)
+    return graph.compile()
 
 class JobAgent:
     def __init__(self):
+        load_env()
         self.builder = self.build()
 
     def build(self):
-        builder  = graph.compile()
+        builder  = get_graph()
         return builder
     
     def run(self, state : AgentState):
-        self.builder.invoke(state)
-
+        return self.builder.invoke(state)
@@ -0,0 +1,103 @@
+import heapq
+import json
+import os
+import re
+import tempfile
+from itertools import islice
+
+# On-disk storage for large runs: jobs are kept one JSON object per line in an
+# append-only file and only ever read back through iterators, so memory use
+# does not grow with the number of scraped jobs.
+
+_EXPERIENCE_RE = re.compile(r'\d+')
+
+
+def get_experience(job):
+    """Minimum years of experience parsed from a job ("2-5 Yrs" -> 2); unknown sorts last."""
+    match = _EXPERIENCE_RE.search(str(job.get("experience", "")))
+    return int(match.group()) if match else 100
+
+
+class JobStore:
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def append(self, jobs):
+        count = 0
+        with open(self.path, "a", encoding="utf-8") as f:
+            for job in jobs:
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def __iter__(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __len__(self):
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "rb") as f:
+            return sum(1 for line in f if line.strip())
+
+    def batches(self, size: int):
+        """Yield (byte offset, job count) for consecutive batches without loading them."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            offset, start, count = 0, 0, 0
+            for line in f:
+                if count == 0:
+                    start = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                count += 1
+                if count == size:
+                    yield start, count
+                    count = 0
+            if count:
+                yield start, count
+
+    def read_batch(self, offset: int, count: int):
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            lines = (line for line in f if line.strip())
+            return [json.loads(line) for line in islice(lines, count)]
+
+
+def external_sort(src: JobStore, dst_path: str, key, chunk_size: int = 5000) -> JobStore:
+    """
+    Sort the jobs of `src` into a new store at `dst_path` with at most
+    `chunk_size` jobs in memory: sorted runs are spilled to temp files and
+    then k-way merged. Like sorted(), the sort is stable.
+    """
+    run_dir = tempfile.mkdtemp(prefix="sort-", dir=os.path.dirname(dst_path) or ".")
+    runs = []
+    try:
+        jobs = iter(src)
+        while True:
+            chunk = list(islice(jobs, chunk_size))
+            if not chunk:
+                break
+            chunk.sort(key=key)
+            run = JobStore(os.path.join(run_dir, f"run-{len(runs)}.ndjson"))
+            run.append(chunk)
+            runs.append(run)
+            del chunk
+
+        tmp_path = dst_path + ".part"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        JobStore(tmp_path).append(heapq.merge(*runs, key=key))
+        os.replace(tmp_path, dst_path)
+    finally:
+        for run in runs:
+            os.remove(run.path)
+        os.rmdir(run_dir)
+    return JobStore(dst_path)
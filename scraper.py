@@ -1,16 +1,62 @@
-import requests
-from dotenv import load_dotenv
 import random
 import json
 import os
-import re
-
-load_dotenv()
+import time
+from utils import load_env
+from breaker import get_breaker, HALF_OPEN
+
+
+class ScrapeStopped(Exception):
+    """Raised when a board must not be queried any further (open circuit or run deadline reached)."""
+
+
+def fetch(url, headers, params, breaker, deadline=None):
+    """GET with a timeout, bounded by the run deadline (time.monotonic()), recorded on the board's breaker."""
+    import requests
+    if not breaker.allow():
+        if breaker.state == HALF_OPEN:
+            raise ScrapeStopped("circuit half-open (trial request in flight)")
+        raise ScrapeStopped(f"circuit open ({breaker.remaining_cooldown():.0f}s cool-down left)")
+    timeout = float(os.getenv("SCRAPE_REQUEST_TIMEOUT", 10))
+    capped = False
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ScrapeStopped("deadline exceeded")
+        capped = remaining < timeout
+        timeout = min(timeout, remaining)
+    start = time.monotonic()
+    try:
+        response = requests.get(url, headers=headers, params=params, timeout=timeout)
+    except requests.Timeout:
+        if capped:
+            elapsed = time.monotonic() - start
+            if elapsed >= breaker.slow_call_seconds:
+                # Slow by the board's own standard before the budget ran out: a slow failure
+                breaker.record(False, elapsed)
+            else:
+                # Cut short by the run budget before it counted as slow: don't hold it against
+                # the board, but release a half-open trial so the breaker can't get stuck
+                breaker.abandon()
+            raise ScrapeStopped("deadline exceeded")
+        breaker.record(False, time.monotonic() - start)
+        raise
+    except Exception:
+        breaker.record(False, time.monotonic() - start)
+        raise
+    breaker.record(response.status_code == 200, time.monotonic() - start)
+    return response
 
 
 class NaurkiScraper:
-    def __init__(self):
-        self.url = "https://www.naukri.com/jobapi/v3/search"
+    def __init__(self, base_url=None):
+        load_env()
+        self.name = "naukri"
+        self.breaker = get_breaker(self.name)
+        self.stopped_reason = None
+        # Point at a local simulator (see simulator.py) with NAUKRI_BASE_URL or base_url
+        self.base_url = (base_url or os.getenv("NAUKRI_BASE_URL") or "https://www.naukri.com").rstrip("/")
+        self.url = self.base_url + "/jobapi/v3/search"
         self.system_id = random.randint(100, 999)
         self.app_id = random.randint(100, 999)
         # random 4 character string include alpha numeric character
@@ -76,7 +122,7 @@ class NaurkiScraper:
                     # -- URL Correction --
                     url = job.get('jdURL')
                     if url and not url.startswith('http'):
-                        url = "https://www.naukri.com" + url
+                        url = self.base_url + url
                     
                     # -- Append to List --
                     jobs_data.append({
@@ -96,15 +142,20 @@ class NaurkiScraper:
 
             return jobs_data
 
-    def scrape(self, location, search_term, job_type, experience, page_count):
+    def scrape(self, location, search_term, job_type, experience, page_count, deadline=None):
+        jobs = []
+        for jobs_data in self.iter_pages(location, search_term, job_type, experience, page_count, deadline):
+            jobs.extend(jobs_data)
+        return jobs
+
+    def iter_pages(self, location, search_term, job_type, experience, page_count, deadline=None):
+        """Yield the parsed jobs of one result page at a time; stops early (see stopped_reason) on an open circuit or the deadline."""
         job_type_dict = {
             "Work from office" : "0",
             "Remote" : "2",
             "Hybrid" : "3"
         }
 
-        jobs = []
-
         params = {
             "location": location,
             "keyword": search_term,
@@ -123,20 +174,22 @@ class NaurkiScraper:
             params["pageNo"] = str(i+1)
             
             try:
-                response = requests.get(self.url, headers=self.headers, params=params)
+                response = fetch(self.url, self.headers, params, self.breaker, deadline)
                 print(f"Status Code: {response.status_code}")
             
                 if response.status_code == 200:
                     data = response.json()
                     jobs_data = self.parsed_naukri_data(data)
-                    jobs.extend(jobs_data)
+                    yield jobs_data
 
                 else:
                     print(f"Error: {response.text}")
+            except ScrapeStopped as e:
+                self.stopped_reason = str(e)
+                print(f"Stopping {self.name}: {e}")
+                return
             except Exception as e:
                 print(f"Exception: {str(e)}")
-
-        return jobs
     
 HIRIST_LOCATIONS = {
     "Metros": 87,
@@ -281,8 +334,14 @@ HIRIST_LOCATIONS = {
 }
 
 class HiristScraper:
-    def __init__(self):
-        self.url = "https://gladiator.hirist.tech/job/search"
+    def __init__(self, base_url=None):
+        load_env()
+        self.name = "hirist"
+        self.breaker = get_breaker(self.name)
+        self.stopped_reason = None
+        # Point at a local simulator (see simulator.py) with HIRIST_BASE_URL or base_url
+        self.base_url = (base_url or os.getenv("HIRIST_BASE_URL") or "https://gladiator.hirist.tech").rstrip("/")
+        self.url = self.base_url + "/job/search"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Mobile Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
@@ -365,7 +424,14 @@ class HiristScraper:
                 
         return 132 
 
-    def scrape(self, query, location, min_exp=2, max_exp=3, page_count=1, size=20):
+    def scrape(self, query, location, min_exp=2, max_exp=3, page_count=1, size=20, deadline=None):
+        all_jobs = []
+        for jobs in self.iter_pages(query, location, min_exp, max_exp, page_count, size, deadline):
+            all_jobs.extend(jobs)
+        return all_jobs
+
+    def iter_pages(self, query, location, min_exp=2, max_exp=3, page_count=1, size=20, deadline=None):
+        """Yield the parsed jobs of one result page at a time; stops early (see stopped_reason) on an open circuit or the deadline."""
         loc_names = []
         if location:
             loc_names = [l.strip() for l in location.split(',') if l.strip()]
@@ -378,7 +444,6 @@ class HiristScraper:
             loc_ids.add(self.get_location_id(name))
 
         loc_param = ",".join(map(str, loc_ids))
-        all_jobs = []
         
         for page in range(page_count):
             params = {
@@ -392,19 +457,21 @@ class HiristScraper:
             }
 
             try:
-                response = requests.get(self.url, headers=self.headers, params=params)
+                response = fetch(self.url, self.headers, params, self.breaker, deadline)
                 print(f"Status Code: {response.status_code}")
 
                 if response.status_code == 200:
                     data = response.json()
                     jobs = self.parsed_hirist_data(data)
-                    all_jobs.extend(jobs)
+                    yield jobs
                 else:
                     print(f"Error: {response.text}")
+            except ScrapeStopped as e:
+                self.stopped_reason = str(e)
+                print(f"Stopping {self.name}: {e}")
+                return
             except Exception as e:
                 print(f"Exception: {str(e)}")
-                
-        return all_jobs
 
 if __name__ == "__main__":
 
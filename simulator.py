@@ -0,0 +1,335 @@
+"""
+Local stand-in for the Naukri (`/jobapi/v3/search`) and Hirist (`/job/search`)
+endpoints, for load and failure-injection testing of the scrapers without
+touching the real sites.
+
+    python simulator.py serve --port 8765 --latency lognormal:-3,0.8 --rate-429 0.05 --rate-5xx 0.02
+    NAUKRI_BASE_URL=http://127.0.0.1:8765 HIRIST_BASE_URL=http://127.0.0.1:8765 python cli.py scrape ...
+
+    python simulator.py load --workers 32 --runs 200 --pages 5   # in-process server + load driver
+
+Postings are generated deterministically from (board, query, position), so the
+same page always returns the same jobs. GET /__stats returns request counters.
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from zlib import crc32
+
+TITLES = ["Software Engineer", "Python Developer", "Backend Engineer", "Data Engineer", "ML Engineer",
+          "GenAI Engineer", "Full Stack Developer", "DevOps Engineer", "SDE II", "AI Agent Developer"]
+COMPANIES = ["Acme Labs", "Globex", "Initech", "Umbrella Tech", "Hooli", "Stark Industries",
+             "Wayne Enterprises", "Cyberdyne", "Soylent", "Vandelay Industries"]
+SKILLS = ["Python", "FastAPI", "Django", "Flask", "LangChain", "LangGraph", "GenAI", "Generative AI",
+          "AI Agents", "SQL", "PostgreSQL", "Redis", "Docker", "Kubernetes", "AWS", "GCP", "React",
+          "Machine Learning", "NLP", "PyTorch", "REST API", "Microservices", "fast api", "Gen AI"]
+_EPOCH_MS = int(time.time() * 1000)
+LOCATIONS = ["Delhi", "Gurugram", "Noida", "Bangalore", "Hyderabad", "Pune", "Mumbai", "Chennai", "Remote"]
+
+
+@dataclass
+class SimulatorConfig:
+    latency: str = "fixed:0"        # fixed:S | uniform:A,B | normal:MEAN,STD | lognormal:MU,SIGMA | exp:MEAN
+    rate_429: float = 0.0           # share of requests answered with 429 Too Many Requests
+    rate_5xx: float = 0.0           # share of requests answered with 500/502/503
+    jobs_per_query: int = 1000      # total postings available for a query
+    max_pages: int = 50             # pages past this return no results, like the real pagination limit
+    duplicate_rate: float = 0.0     # share of postings that repeat an earlier posting (same id)
+    seed: int = 0
+
+
+def parse_latency(spec: str):
+    """Turn a latency spec such as "lognormal:-3,0.8" into a sampler returning seconds."""
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v.strip()] if args else []
+    samplers = {
+        "fixed": lambda rnd: values[0] if values else 0.0,
+        "uniform": lambda rnd: rnd.uniform(values[0], values[1]),
+        "normal": lambda rnd: rnd.gauss(values[0], values[1]),
+        "lognormal": lambda rnd: rnd.lognormvariate(values[0], values[1]),
+        "exp": lambda rnd: rnd.expovariate(1 / values[0]),
+    }
+    if kind not in samplers:
+        raise ValueError(f"Unknown latency distribution: {kind}")
+    sampler = samplers[kind]
+    return lambda rnd: max(0.0, sampler(rnd))
+
+
+def _rng(*parts) -> random.Random:
+    return random.Random(crc32("|".join(map(str, parts)).encode()))
+
+
+def _posting(config, board, query, position):
+    """Skills, experience etc. for the posting at `position` of a query's result list."""
+    if config.duplicate_rate and position and _rng(config.seed, board, query, position, "dup").random() < config.duplicate_rate:
+        position = _rng(config.seed, board, query, position, "dup-of").randrange(position)
+    rnd = _rng(config.seed, board, query, position)
+    min_exp = rnd.randint(0, 10)
+    return {
+        "id": crc32(f"{config.seed}|{board}|{query}|{position}".encode()),
+        "title": f"{rnd.choice(TITLES)}" + (f" - {query}" if query and rnd.random() < 0.3 else ""),
+        "company": rnd.choice(COMPANIES),
+        "rating": round(rnd.uniform(2.5, 4.8), 1),
+        "locations": rnd.sample(LOCATIONS, rnd.randint(1, 3)),
+        "min_exp": min_exp,
+        "max_exp": min_exp + rnd.randint(1, 5),
+        "min_sal": rnd.randint(3, 30),
+        "skills": rnd.sample(SKILLS, rnd.randint(3, 8)),
+        "created_ms": _EPOCH_MS - rnd.randint(0, 7 * 24 * 3600 * 1000),
+    }
+
+
+def naukri_payload(config, query, page, size):
+    jobs = []
+    if page <= config.max_pages:
+        start = (page - 1) * size
+        for position in range(start, min(start + size, config.jobs_per_query)):
+            p = _posting(config, "naukri", query, position)
+            slug = p["title"].lower().replace(" ", "-")
+            experience = f"{p['min_exp']}-{p['max_exp']} Yrs"
+            half = len(p["skills"]) // 2
+            jobs.append({
+                "jobId": str(p["id"]),
+                "title": p["title"],
+                "companyName": p["company"],
+                "logoPath": f"https://img.example.com/logo/{p['id'] % 997}.gif",
+                "ambitionBoxData": {"AggregateRating": str(p["rating"]), "ReviewsCount": p["id"] % 5000},
+                "experienceText": experience,
+                "placeholders": [
+                    {"type": "experience", "label": experience},
+                    {"type": "salary", "label": f"{p['min_sal']}-{p['min_sal'] + 8} Lacs PA"},
+                    {"type": "location", "label": ", ".join(p["locations"])},
+                ],
+                "createdDate": p["created_ms"],
+                "keySkills": {
+                    "preferred": p["skills"][:half],
+                    "other": p["skills"][half:] + p["skills"][:1],
+                    "tagsOrder": ["preferred", "other"],
+                },
+                "jdURL": f"/job-listings-{slug}-{p['id']}",
+                "jobDescription": f"<p>{p['company']} is hiring a {p['title']}.</p><ul>"
+                                  + "".join(f"<li>Hands-on experience with {s}</li>" for s in p["skills"])
+                                  + f"</ul><p>{experience} of experience required.</p>",
+            })
+    return {"noOfJobs": config.jobs_per_query, "jobDetails": jobs}
+
+
+def hirist_payload(config, query, page, size):
+    jobs = []
+    if page < config.max_pages:
+        start = page * size
+        for position in range(start, min(start + size, config.jobs_per_query)):
+            p = _posting(config, "hirist", query, position)
+            jobs.append({
+                "id": p["id"],
+                "title": p["title"],
+                "companyData": {
+                    "companyName": p["company"],
+                    "logo": f"https://img.example.com/hirist/{p['id'] % 997}.png",
+                    "ambitionBoxInfo": {"aggregateRating": p["rating"]},
+                },
+                "minRatingAb": p["rating"],
+                "locations": [{"name": name} for name in p["locations"]],
+                "minSal": p["min_sal"],
+                "maxSal": p["min_sal"] + 8,
+                "min": p["min_exp"],
+                "max": p["max_exp"],
+                "createdTimeMs": p["created_ms"],
+                "tags": [{"id": crc32(s.encode()) % 10000, "name": s} for s in p["skills"]],
+                "jobDetailUrl": f"https://www.hirist.tech/j/{p['id']}",
+            })
+    return {"count": config.jobs_per_query, "data": jobs}
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, config: SimulatorConfig):
+        super().__init__(address, SimulatorHandler)
+        self.config = config
+        self.latency = parse_latency(config.latency)
+        self.rnd = random.Random(config.seed)
+        self.stats = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        server: SimulatorServer = self.server
+        config = server.config
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/__stats":
+            with server.lock:
+                return self._send(200, dict(server.stats))
+        if url.path not in ("/jobapi/v3/search", "/job/search"):
+            return self._send(404, {"message": "Not found"})
+
+        with server.lock:
+            delay = server.latency(server.rnd)
+            roll = server.rnd.random()
+            status_5xx = server.rnd.choice([500, 502, 503])
+        time.sleep(delay)
+
+        board = "naukri" if url.path == "/jobapi/v3/search" else "hirist"
+        if roll < config.rate_429:
+            status, body, headers = 429, {"message": "Too Many Requests"}, {"Retry-After": "1"}
+        elif roll < config.rate_429 + config.rate_5xx:
+            status, body, headers = status_5xx, {"message": "Upstream error"}, None
+        elif board == "naukri":
+            status, headers = 200, None
+            body = naukri_payload(config, params.get("keyword", ""), int(params.get("pageNo", 1)),
+                                  int(params.get("noOfResults", 20)))
+        else:
+            status, headers = 200, None
+            body = hirist_payload(config, params.get("query", ""), int(params.get("page", 0)),
+                                  int(params.get("size", 20)))
+        with server.lock:
+            server.stats[f"{board}:{status}"] += 1
+            server.stats["requests"] += 1
+        self._send(status, body, headers)
+
+
+def start_simulator(config: SimulatorConfig = None, host="127.0.0.1", port=0) -> SimulatorServer:
+    """Start the simulator in a background thread; port 0 picks a free port. Call .shutdown() to stop."""
+    server = SimulatorServer((host, port), config or SimulatorConfig())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_load(server: SimulatorServer, workers: int, runs: int, pages: int, query: str, location: str,
+             breaker_options: dict = None):
+    """
+    Run `runs` concurrent scrapes (alternating boards) against the simulator and report throughput.
+
+    The board circuit breakers are reset first so every load run starts from a clean
+    state; `breaker_options` (CircuitBreaker kwargs, e.g. {"enabled": False} or
+    {"cooldown": 1}) override the env config for this run.
+    """
+    from scraper import NaurkiScraper, HiristScraper
+    from breaker import get_breaker, reset_breakers
+
+    reset_breakers(**(breaker_options or {}))
+
+    def one(i):
+        start = time.monotonic()
+        if i % 2:
+            scraper = HiristScraper(base_url=server.base_url)
+            jobs = scraper.scrape(query=query, location=location, page_count=pages)
+        else:
+            scraper = NaurkiScraper(base_url=server.base_url)
+            jobs = scraper.scrape(location=location, search_term=query,
+                                  job_type="Hybrid", experience=2, page_count=pages)
+        return time.monotonic() - start, [job["job_id"] for job in jobs], scraper.stopped_reason
+
+    start = time.monotonic()
+    # Scrapers print one line per request; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(one, range(runs)))
+    elapsed = time.monotonic() - start
+
+    durations = sorted(d for d, _, _ in results)
+    job_ids = [job_id for _, ids, _ in results for job_id in ids]
+    # Scrapes the breaker stopped before all pages were requested: these measure skipping, not load
+    short_circuited = sum(1 for _, _, reason in results if reason and reason.startswith("circuit"))
+    with server.lock:
+        stats = dict(server.stats)
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "requests": stats.get("requests", 0),
+        "requests_planned": runs * pages,
+        "requests_per_min": round(stats.get("requests", 0) / elapsed * 60),
+        "scrapes": runs,
+        "scrapes_short_circuited": short_circuited,
+        "scrape_p50_s": round(durations[len(durations) // 2], 3),
+        "scrape_p95_s": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+        "jobs": len(job_ids),
+        "unique_jobs": len(set(job_ids)),
+        "status_counts": {k: v for k, v in stats.items() if k != "requests"},
+        "breakers": {name: get_breaker(name).stats() for name in ("naukri", "hirist")},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("serve", "load"):
+        p = sub.add_parser(name)
+        p.add_argument("--host", default="127.0.0.1")
+        p.add_argument("--port", type=int, default=8765 if name == "serve" else 0)
+        p.add_argument("--latency", default="fixed:0", help="fixed:S | uniform:A,B | normal:MEAN,STD | lognormal:MU,SIGMA | exp:MEAN")
+        p.add_argument("--rate-429", type=float, default=0.0)
+        p.add_argument("--rate-5xx", type=float, default=0.0)
+        p.add_argument("--jobs-per-query", type=int, default=1000)
+        p.add_argument("--max-pages", type=int, default=50)
+        p.add_argument("--duplicate-rate", type=float, default=0.0)
+        p.add_argument("--seed", type=int, default=0)
+    load = sub.choices["load"]
+    load.add_argument("--workers", type=int, default=16)
+    load.add_argument("--runs", type=int, default=100, help="number of scrape() calls")
+    load.add_argument("--pages", type=int, default=5)
+    load.add_argument("--query", default="Python Developer")
+    load.add_argument("--location", default="Delhi, Noida")
+    load.add_argument("--no-breaker", action="store_true", help="disable the circuit breakers (stats only)")
+    load.add_argument("--breaker-cooldown", type=float, default=None, help="override BREAKER_COOLDOWN")
+    load.add_argument("--breaker-min-calls", type=int, default=None, help="override BREAKER_MIN_CALLS")
+    load.add_argument("--breaker-failure-rate", type=float, default=None, help="override BREAKER_FAILURE_RATE")
+    args = parser.parse_args(argv)
+
+    config = SimulatorConfig(latency=args.latency, rate_429=args.rate_429, rate_5xx=args.rate_5xx,
+                             jobs_per_query=args.jobs_per_query, max_pages=args.max_pages,
+                             duplicate_rate=args.duplicate_rate, seed=args.seed)
+    server = start_simulator(config, args.host, args.port)
+    if args.command == "serve":
+        print(f"Job board simulator listening on {server.base_url}")
+        print(f"  NAUKRI_BASE_URL={server.base_url} HIRIST_BASE_URL={server.base_url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
+        return
+    breaker_options = {"enabled": not args.no_breaker}
+    for key, value in (("cooldown", args.breaker_cooldown), ("min_calls", args.breaker_min_calls),
+                       ("failure_rate", args.breaker_failure_rate)):
+        if value is not None:
+            breaker_options[key] = value
+    report = run_load(server, args.workers, args.runs, args.pages, args.query, args.location, breaker_options)
+    server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
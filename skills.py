@@ -0,0 +1,303 @@
+import re
+import threading
+
+# Canonical skill taxonomy and a bitset index over jobs.
+#
+# Skills arrive as free text ("FastAPI", "fast api", "GenAI, Generative AI").
+# SkillTaxonomy maps every spelling to one canonical skill id; a set of skills
+# is then a Python int with bit <id> set, so overlap is (a & b).bit_count().
+# SkillIndex additionally keeps, per skill, a bitset over job rows, so queries
+# over the whole job set ("jobs with all must-haves", "jobs matching >= 3
+# preferred skills") are a handful of big-int AND/OR/XOR operations.
+#
+# Only the canonical taxonomy is shared process-wide, and it is read-only.
+# Skills outside it get their bits in a copy (SkillTaxonomy.extend()) owned by
+# one index or run, so a long-lived worker does not accumulate every free-text
+# skill it has ever seen.
+
+# canonical name -> aliases (matched after normalisation, see skill_key).
+# Abbreviations that also stand for something else in job postings ("cv":
+# Computer Vision / résumé, "tf": TensorFlow / Terraform, "dl", "ts") are left
+# out on purpose: a wrong merge silently inflates overlap, a missed one only
+# leaves the abbreviation as a skill of its own.
+SKILL_ALIASES = {
+    "Python": ["python3", "py"],
+    "FastAPI": ["fast api"],
+    "Django": ["django rest framework", "drf"],
+    "Flask": [],
+    "LangChain": ["lang chain"],
+    "LangGraph": ["lang graph"],
+    "LlamaIndex": ["llama index"],
+    "Generative AI": ["genai", "gen ai", "generative artificial intelligence"],
+    "AI Agents": ["ai agent", "agentic ai", "llm agents", "autonomous agents"],
+    "Large Language Models": ["llm", "llms", "large language model"],
+    "Artificial Intelligence": ["ai"],
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": [],
+    "PyTorch": ["torch"],
+    "TensorFlow": [],
+    "SQL": [],
+    "PostgreSQL": ["postgres", "psql"],
+    "MySQL": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "AWS": ["amazon web services"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Azure": ["microsoft azure"],
+    "REST API": ["rest", "rest apis", "restful", "restful api", "restful apis"],
+    "Microservices": ["micro services", "microservice"],
+    "JavaScript": ["js"],
+    "TypeScript": [],
+    "Node.js": ["node", "nodejs"],
+    "React": ["reactjs", "react js"],
+    "Go": ["golang"],
+    "CI/CD": ["ci cd", "cicd"],
+}
+
+# Placeholder values the scrapers emit when a board has no skills
+_IGNORED = {"", "not specified", "na", "n/a", "none", "others"}
+_PUNCT_RE = re.compile(r"[^\w+#]+")
+_SPLIT_RE = re.compile(r"[,;|\n]")
+
+
+def skill_key(skill: str) -> str:
+    """Case, punctuation and spacing insensitive key: "Fast-API", "fast api" and "FastAPI" -> "fastapi"."""
+    return _PUNCT_RE.sub("", str(skill).lower())
+
+
+def split_skills(skills) -> list[str]:
+    """Accept a comma separated string (as produced by the scrapers / preferences) or a list."""
+    if skills is None:
+        return []
+    if isinstance(skills, str):
+        skills = _SPLIT_RE.split(skills)
+    return [s.strip() for s in skills if s and s.strip().lower() not in _IGNORED]
+
+
+class SkillTaxonomy:
+    """Assigns a stable bit to every canonical skill; unknown skills get a new bit on first sight unless frozen."""
+
+    def __init__(self, aliases: dict[str, list[str]] = None, frozen: bool = False):
+        self.frozen = frozen
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for canonical, alias_list in (SKILL_ALIASES if aliases is None else aliases).items():
+            skill_id = self._new(canonical)
+            for alias in alias_list:
+                self._ids.setdefault(skill_key(alias), skill_id)
+
+    def _new(self, name: str) -> int:
+        skill_id = len(self.names)
+        self.names.append(name)
+        self._ids[skill_key(name)] = skill_id
+        return skill_id
+
+    def extend(self) -> "SkillTaxonomy":
+        """Unfrozen copy with the same ids, for assigning bits to unknown skills without touching this one."""
+        child = SkillTaxonomy({})
+        with self._lock:
+            child.names = list(self.names)
+            child._ids = dict(self._ids)
+        return child
+
+    def skill_id(self, skill: str, add: bool = True) -> int | None:
+        key = skill_key(skill)
+        if not key:
+            return None
+        if key not in self._ids:
+            if not add or self.frozen:
+                return None
+            with self._lock:
+                if key not in self._ids:
+                    self._new(skill.strip())
+        return self._ids[key]
+
+    def canonical(self, skill: str) -> str | None:
+        skill_id = self.skill_id(skill, add=False)
+        return None if skill_id is None else self.names[skill_id]
+
+    def encode(self, skills, add: bool = True) -> int:
+        """Bitmask of the given skills (string or list)."""
+        mask = 0
+        for skill in split_skills(skills):
+            skill_id = self.skill_id(skill, add)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def decode(self, mask: int) -> list[str]:
+        return [self.names[i] for i in _bits(mask)]
+
+
+def _bits(bitset: int):
+    """Positions of the set bits, lowest first (byte-wise, so it stays linear for large row bitsets)."""
+    for i, byte in enumerate(bitset.to_bytes((bitset.bit_length() + 7) // 8, "little")):
+        while byte:
+            low = byte & -byte
+            yield (i << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+def _rows_to_bitset(rows) -> int:
+    buf = bytearray((max(rows) >> 3) + 1) if rows else bytearray()
+    for row in rows:
+        buf[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buf, "little")
+
+
+class SkillIndex:
+    """
+    Skills of a job set, encoded once and queried with bitwise operations.
+
+    Row bitsets (ints with bit <row> set) are what the set-wide queries return;
+    use job_ids_of() to turn them back into job ids, or .bit_count() to count them.
+    Skills unknown to a frozen (e.g. the shared) taxonomy get bits in the index's own copy.
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy = None):
+        taxonomy = taxonomy or get_taxonomy()
+        self.taxonomy = taxonomy.extend() if taxonomy.frozen else taxonomy
+        self.job_ids: list = []
+        self.masks: list[int] = []
+        self._rows: dict = {}
+        self._posting_rows: dict[int, list[int]] = {}
+        self._postings: dict[int, int] = {}
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def add(self, job_id, skills) -> int:
+        mask = self.taxonomy.encode(skills)
+        row = len(self.job_ids)
+        self.job_ids.append(job_id)
+        self.masks.append(mask)
+        self._rows[str(job_id)] = row
+        for skill_id in _bits(mask):
+            self._posting_rows.setdefault(skill_id, []).append(row)
+            self._postings.pop(skill_id, None)
+        return row
+
+    def add_jobs(self, jobs):
+        for job in jobs:
+            self.add(job.get("job_id"), job.get("skills"))
+        return self
+
+    @property
+    def all_rows(self) -> int:
+        return (1 << len(self.job_ids)) - 1
+
+    def posting(self, skill_id: int) -> int:
+        """Bitset of the rows having this skill (built lazily, cached until the next add)."""
+        if skill_id not in self._postings:
+            self._postings[skill_id] = _rows_to_bitset(self._posting_rows.get(skill_id, []))
+        return self._postings[skill_id]
+
+    def _mask(self, skills) -> int:
+        # Unknown query skills get a bit too (with an empty posting), so they count as a skill no job has
+        return skills if isinstance(skills, int) else self.taxonomy.encode(skills)
+
+    def _skill_ids(self, skills):
+        return list(_bits(self._mask(skills)))
+
+    # -- Single job queries --
+    def job_mask(self, job_id) -> int:
+        return self.masks[self._rows[str(job_id)]]
+
+    def overlap(self, job_id, skills) -> int:
+        return (self.job_mask(job_id) & self._mask(skills)).bit_count()
+
+    def coverage(self, job_id, skills) -> float:
+        """Share of the given (e.g. preferred) skills the job asks for."""
+        wanted = self._mask(skills)
+        return (self.job_mask(job_id) & wanted).bit_count() / wanted.bit_count() if wanted else 0.0
+
+    def missing(self, job_id, skills) -> list[str]:
+        wanted = self._mask(skills)
+        return self.taxonomy.decode(wanted & ~self.job_mask(job_id))
+
+    # -- Whole job set queries (return row bitsets) --
+    def jobs_with_any(self, skills) -> int:
+        rows = 0
+        for skill_id in self._skill_ids(skills):
+            rows |= self.posting(skill_id)
+        return rows
+
+    def jobs_with_all(self, skills) -> int:
+        rows = self.all_rows
+        for skill_id in self._skill_ids(skills):
+            rows &= self.posting(skill_id)
+        return rows
+
+    def jobs_missing_any(self, must_have) -> int:
+        """Rows lacking at least one of the must-have skills."""
+        return self.all_rows & ~self.jobs_with_all(must_have)
+
+    def overlap_counts(self, skills) -> list[int]:
+        """Per-row count of matching skills as bit planes (planes[i] holds bit i of every row's count)."""
+        planes: list[int] = []
+        for skill_id in self._skill_ids(skills):
+            carry = self.posting(skill_id)
+            for i, plane in enumerate(planes):
+                planes[i] = plane ^ carry
+                carry &= plane
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+        return planes
+
+    def jobs_with_overlap(self, skills, min_count: int, planes: list[int] = None) -> int:
+        """Rows matching at least `min_count` of the skills."""
+        if min_count <= 0:
+            return self.all_rows
+        planes = self.overlap_counts(skills) if planes is None else planes
+        greater, equal = 0, self.all_rows
+        for i in range(max(len(planes), min_count.bit_length()) - 1, -1, -1):
+            plane = planes[i] if i < len(planes) else 0
+            if (min_count >> i) & 1:
+                equal &= plane
+            else:
+                greater |= equal & plane
+                equal &= ~plane
+        return greater | equal
+
+    def rank(self, skills, limit: int = None, exclude: int = 0) -> list:
+        """Job ids ordered by number of matching skills (most first), skipping `exclude` rows and non-matching jobs."""
+        planes = self.overlap_counts(skills)
+        result, taken = [], exclude
+        for count in range(len(self._skill_ids(skills)), 0, -1):
+            rows = self.jobs_with_overlap(skills, count, planes) & ~taken
+            taken |= rows
+            for row in _bits(rows):
+                result.append(self.job_ids[row])
+                if limit is not None and len(result) >= limit:
+                    return result
+        return result
+
+    def job_ids_of(self, rows: int) -> list:
+        return [self.job_ids[row] for row in _bits(rows)]
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Process-wide canonical taxonomy, so skill ids agree between nodes, filters and reports; frozen, use .extend() to encode free text."""
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            _taxonomy = SkillTaxonomy(frozen=True)
+        return _taxonomy
+
+
+def encode_preference(preference: dict, taxonomy: SkillTaxonomy) -> tuple[int, int]:
+    """(preferred, must-have) skill masks of a preference dict; must-haves come from "must_have_skills" if given."""
+    preference = preference or {}
+    return (taxonomy.encode(preference.get("skills")),
+            taxonomy.encode(preference.get("must_have_skills")))
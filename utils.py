@@ -1,18 +1,53 @@
-from openai import OpenAI
-from dotenv import load_dotenv
 import json
 import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, List, Dict, Tuple
 
 
-load_dotenv()
+# Heavy dependencies (openai, dotenv) are imported on first use so that
+# importing this module, e.g. only for the TOON converter, stays cheap.
+@lru_cache(maxsize=None)
+def load_env():
+    from dotenv import load_dotenv
+    load_dotenv()
 
-api_key = os.getenv("OPENAI_API_KEY")
-model = os.getenv("OPENAI_MODEL")
-base_url = os.getenv("OPENAI_BASE_URL")
+@lru_cache(maxsize=None)
+def get_client():
+    from openai import OpenAI
+    load_env()
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), base_url=os.getenv("OPENAI_BASE_URL"))
 
-import json
-from collections import OrderedDict
-from typing import Any, List, Dict, Tuple
+MODEL_TIERS = ("fast", "strong")
+
+def get_model(tier: str = None):
+    """Model for a tier: OPENAI_MODEL_FAST / OPENAI_MODEL_STRONG, falling back to OPENAI_MODEL."""
+    load_env()
+    if tier is None:
+        return os.getenv("OPENAI_MODEL")
+    if tier not in MODEL_TIERS:
+        raise ValueError(f"Unknown model tier: {tier}")
+    return os.getenv(f"OPENAI_MODEL_{tier.upper()}") or os.getenv("OPENAI_MODEL")
+
+def get_node_tier(node: str, default: str) -> str:
+    """Tier a graph node runs on, overridable per node with MODEL_TIER_<NODE> (e.g. MODEL_TIER_FORMAT_JOB_DATA=fast)."""
+    load_env()
+    tier = os.getenv(f"MODEL_TIER_{node.upper()}", default).strip().lower()
+    if tier not in MODEL_TIERS:
+        raise ValueError(f"Unknown model tier for {node}: {tier}")
+    return tier
+
+def get_model_price(tier: str):
+    """(input, cached input, output) USD per 1M tokens from MODEL_PRICE_<TIER>="0.15,0.075,0.6", or None."""
+    load_env()
+    value = os.getenv(f"MODEL_PRICE_{(tier or 'default').upper()}")
+    if not value:
+        return None
+    prices = [float(v) for v in value.split(",")]
+    if len(prices) == 2:
+        prices = [prices[0], prices[0], prices[1]]
+    return tuple(prices)
 
 def _is_primitive(x):
     return x is None or isinstance(x, (str, int, float, bool))
@@ -191,19 +226,102 @@ def convert_json_to_toon(obj_or_json: Any) -> str:
     # If top-level is a dict, we convert directly
     return json_to_toon(parsed)
 
-def llm_structure(instruction:str):
-    client = OpenAI(api_key=api_key, base_url=base_url)
+class TokenUsage:
+    """Thread-safe running totals of the `usage` block of chat completions, incl. provider prompt-cache hits, per model tier."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.tiers: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, usage, tier: str = None, latency: float = 0.0):
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+        prompt = usage.prompt_tokens or 0
+        completion = usage.completion_tokens or 0
+        price = get_model_price(tier)
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt
+            self.cached_tokens += cached
+            self.completion_tokens += completion
+            t = self.tiers.setdefault(tier or "default", {
+                "model": get_model(tier), "calls": 0, "latency_s": 0.0, "prompt_tokens": 0,
+                "cached_prompt_tokens": 0, "completion_tokens": 0, "cost_usd": None, "uncached_cost_usd": None})
+            t["calls"] += 1
+            t["latency_s"] += latency
+            t["prompt_tokens"] += prompt
+            t["cached_prompt_tokens"] += cached
+            t["completion_tokens"] += completion
+            if price:
+                cost = ((prompt - cached) * price[0] + cached * price[1] + completion * price[2]) / 1_000_000
+                t["cost_usd"] = (t["cost_usd"] or 0.0) + cost
+                # What the same calls would have cost without any cache hit
+                uncached_cost = (prompt * price[0] + completion * price[2]) / 1_000_000
+                t["uncached_cost_usd"] = (t["uncached_cost_usd"] or 0.0) + uncached_cost
+
+    def summary(self) -> dict:
+        # Share of the prompt price of these same calls saved by cache hits, given cached
+        # tokens are billed at (1 - discount); 0 when no prefix reached the provider's cache minimum
+        discount = float(os.getenv("CACHED_TOKEN_DISCOUNT", 0.5))
+        with self._lock:
+            tiers = {}
+            for name, t in self.tiers.items():
+                tiers[name] = {**t,
+                               "latency_s": round(t["latency_s"], 3),
+                               "avg_latency_s": round(t["latency_s"] / t["calls"], 3),
+                               "cost_usd": None if t["cost_usd"] is None else round(t["cost_usd"], 6),
+                               "uncached_cost_usd": None if t["uncached_cost_usd"] is None else round(t["uncached_cost_usd"], 6),
+                               "cost_saved_usd": None if t["cost_usd"] is None
+                               else round(t["uncached_cost_usd"] - t["cost_usd"], 6)}
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_tokens,
+                "uncached_prompt_tokens": self.prompt_tokens - self.cached_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cache_hit_rate": round(self.cached_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+                "prompt_cost_saved": round(self.cached_tokens * discount / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+                "tiers": tiers,
+            }
+
+
+_usages: dict[str, TokenUsage] = {}
+_usages_lock = threading.Lock()
+
+def get_token_usage(key: str) -> TokenUsage:
+    """One TokenUsage per run (keyed by its output directory), shared by all nodes and batches."""
+    with _usages_lock:
+        return _usages.setdefault(key, TokenUsage())
+
+def pop_token_usage(key: str) -> TokenUsage:
+    with _usages_lock:
+        return _usages.pop(key, None) or TokenUsage()
+
+def llm_structure(instruction:str, usage: TokenUsage = None, tier: str = None, system: str = None):
+    client = get_client()
+    start = time.monotonic()
     response = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": instruction},],
+        model=get_model(tier),
+        messages=([{"role": "system", "content": system}] if system else []) + [{"role": "user", "content": instruction},],
         response_format={"type": "json_object"},)
+    if usage is not None:
+        usage.record(response.usage, tier, time.monotonic() - start)
     return json.loads(response.choices[0].message.content)
 
-def llm(instruction:str):
-    client = OpenAI(api_key=api_key, base_url=base_url)
+def llm(instruction:str, usage: TokenUsage = None, tier: str = None, system: str = None):
+    client = get_client()
+    start = time.monotonic()
     response = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": instruction},],)
+        model=get_model(tier),
+        messages=([{"role": "system", "content": system}] if system else []) + [{"role": "user", "content": instruction},],)
+    if usage is not None:
+        usage.record(response.usage, tier, time.monotonic() - start)
     return response.choices[0].message.content
 
 def parsed_user_data(data: str) -> dict: